@@ -1,37 +1,167 @@
 # Import necessary libraries
 from fastapi import FastAPI, HTTPException, File, UploadFile, Form, Request, Path
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, FileResponse, ORJSONResponse, StreamingResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 from pydantic import BaseModel
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Union, AsyncIterator, Iterable, Callable, Any
 import os
+import re
+import sys
+import asyncio
+import time
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 import shutil
-from datetime import datetime
+import wave
+import io
+from collections import deque, OrderedDict
+from itertools import islice
+from datetime import datetime, timezone
+from contextlib import asynccontextmanager, suppress
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-from collections import defaultdict
+import hashlib
+from urllib.parse import quote
+from cachetools import TTLCache
+import orjson
+import httpx
+import aiofiles
+import redis.asyncio as redis
 
 # Import AI service libraries
-from murf import Murf  # Text-to-Speech
-import assemblyai as aai  # Speech-to-Text
+from murf import AsyncMurf  # Text-to-Speech
 import google.generativeai as genai  # Large Language Model
 
 # Load environment variables
 load_dotenv()
 
+# Per-request details are logged at DEBUG, so they cost nothing unless LOG_LEVEL=DEBUG.
+# Records go through a queue to a listener thread, keeping console writes off the event loop
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+log_listener = QueueListener(log_queue, logging.StreamHandler())
+log_listener.start()
+atexit.register(log_listener.stop)
+
+logger = logging.getLogger("murfai")
+logger.setLevel(LOG_LEVEL)
+logger.addHandler(QueueHandler(log_queue))
+logger.propagate = False
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background workers and release shared connections on shutdown"""
+    # Gemini calls block, so they run in this pool; the default one is sized for CPU work, not network waits
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=BLOCKING_CALL_THREADS))
+    fallback_audio_task = asyncio.create_task(cache_fallback_audio())
+    yield
+    fallback_audio_task.cancel()
+    for task in list(background_tasks):
+        task.cancel()
+    await SHARED_HTTP_TRANSPORT.aclose()
+    if redis_client:
+        await redis_client.aclose()
+
 app = FastAPI(
     title="30 Days of MurfAI - Conversational AI Assistant",
     description="Complete voice assistant with chat history and memory using Murf AI, AssemblyAI, and Gemini",
-    version="4.0.0"
+    version="4.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# In-memory chat history storage (session_id -> list of messages)
-# For production, consider using Redis, PostgreSQL, or other persistent storage
-chat_sessions: Dict[str, List[Dict[str, str]]] = defaultdict(list)
-
 # Maximum messages to keep in history (to prevent token limits)
 MAX_HISTORY_MESSAGES = 20
 
+# Gemini system instruction for chat, kept byte-identical across requests so providers can cache the prompt prefix
+SYSTEM_PROMPT = (
+    "You are a helpful AI assistant in a voice conversation. "
+    "Continue the conversation naturally, remembering what we discussed earlier."
+)
+
+# Messages kept verbatim in the prompt; older ones are folded into a rolling summary
+SUMMARY_KEEP_MESSAGES = 6
+
+# Older messages are summarized in batches of this size, until then they stay in the prompt verbatim
+SUMMARY_BATCH_MESSAGES = 6
+
+# Idle chat sessions expire after this many seconds
+SESSION_TTL_SECONDS = 3600
+
+# Most sessions kept by the in-memory store before the oldest are evicted
+MAX_SESSIONS = 10_000
+
+# Threads available for blocking SDK calls (each streamed Gemini reply holds one while it waits)
+BLOCKING_CALL_THREADS = 32
+
+# Murf accepts at most 3000 characters per request
+MAX_MURF_CHARS = 3000
+
+# Long replies are split into segments of roughly this size and synthesized concurrently
+TTS_SEGMENT_CHARS = 500
+
+# Uploads are streamed in chunks of this size instead of being read into memory at once
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Largest audio upload accepted, and the formats the browser recorder and AssemblyAI both handle
+MAX_AUDIO_BYTES = 25 * 1024 * 1024
+ALLOWED_AUDIO_TYPES = {
+    "audio/wav", "audio/x-wav", "audio/wave", "audio/webm", "audio/ogg",
+    "audio/mpeg", "audio/mp3", "audio/mp4", "audio/x-m4a", "audio/flac"
+}
+
+# Largest multipart request body accepted: the audio plus room for the form boundaries and text fields
+MAX_UPLOAD_REQUEST_BYTES = MAX_AUDIO_BYTES + 64 * 1024
+
+# Directory for files saved by /audio/upload (created once at import, not per request)
+UPLOADS_DIR = "uploads"
+os.makedirs(UPLOADS_DIR, exist_ok=True)
+
+# Uncompressed uploads are downmixed to 16 kHz mono PCM when ffmpeg is installed; compressed ones
+# (Opus, MP3, AAC) are already smaller than that PCM, so they are always streamed as recorded
+STT_SAMPLE_RATE = 16000
+FFMPEG_PATH = shutil.which("ffmpeg")
+UNCOMPRESSED_AUDIO_TYPES = {"audio/wav", "audio/x-wav", "audio/wave", "audio/flac"}
+FFMPEG_TIMEOUT_SECONDS = 30
+
+# Decoded recordings longer than this are transcribed as overlapping windows in parallel
+LONG_AUDIO_SECONDS = 60
+STT_CHUNK_SECONDS = 30
+STT_CHUNK_OVERLAP_SECONDS = 1
+
+# Windows of one recording uploaded at a time, and the most decoded audio kept (about 58 MB of PCM)
+STT_PARALLEL_WINDOWS = 4
+MAX_DECODED_SECONDS = 30 * 60
+
+# Longest run of words looked for when removing the overlap between neighbouring windows
+MAX_OVERLAP_WORDS = 8
+
+# AssemblyAI transcripts are submitted over REST and polled until they finish
+ASSEMBLYAI_BASE_URL = "https://api.assemblyai.com/v2"
+TRANSCRIPT_POLL_INTERVAL = 0.3
+TRANSCRIPT_TIMEOUT_SECONDS = 300
+
+# Most chat transcriptions running against AssemblyAI at once; further requests wait for a free slot
+TRANSCRIPTION_MAX_CONCURRENT = 8
+
+# Generated TTS audio URLs are cached in Redis (Murf audio links stay valid for 72 hours)
+TTS_CACHE_TTL_SECONDS = 48 * 3600
+
+# Identical LLM prompts within this window are answered from the Redis cache
+LLM_CACHE_TTL_SECONDS = 900
+
+# Most recent LLM answers also kept in process, so repeats skip the Redis round trip (and work without Redis)
+LLM_LOCAL_CACHE_SIZE = 256
+
+# Sentence boundaries used to split text for TTS
+SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
 # Error handling configuration
 FALLBACK_MESSAGES = {
     "stt_error": "I'm having trouble hearing you right now. Please check your microphone and try again.",
@@ -41,108 +171,649 @@ FALLBACK_MESSAGES = {
     "general_error": "Something went wrong on my end. Let me try to help you differently."
 }
 
+# Fallback messages are synthesized once into this directory and served as static files
+FALLBACK_AUDIO_DIR = os.path.join("static", "fallback")
+os.makedirs(FALLBACK_AUDIO_DIR, exist_ok=True)
+
+# error_type -> static URL of the fallback message audio, filled in at startup
+FALLBACK_AUDIO_URLS: Dict[str, str] = {}
+
+# Exception message keywords for each error type, checked in priority order
+ERROR_TYPE_PATTERNS = [
+    ("stt_error", re.compile(r"assemblyai|transcription|speech", re.IGNORECASE)),
+    ("llm_error", re.compile(r"gemini|llm|generate_content", re.IGNORECASE)),
+    ("tts_error", re.compile(r"murf|tts|text_to_speech", re.IGNORECASE)),
+    ("connection_error", re.compile(r"connection|network|timeout", re.IGNORECASE)),
+]
+
 # Utility functions for error handling
 def get_error_type(exception: Exception) -> str:
     """Determine the type of error based on the exception"""
-    error_str = str(exception).lower()
-    
-    if "assemblyai" in error_str or "transcription" in error_str or "speech" in error_str:
-        return "stt_error"
-    elif "gemini" in error_str or "llm" in error_str or "generate_content" in error_str:
-        return "llm_error"
-    elif "murf" in error_str or "tts" in error_str or "text_to_speech" in error_str:
-        return "tts_error"
-    elif "connection" in error_str or "network" in error_str or "timeout" in error_str:
-        return "connection_error"
-    else:
-        return "general_error"
+    error_str = str(exception)
+    
+    for error_type, pattern in ERROR_TYPE_PATTERNS:
+        if pattern.search(error_str):
+            return error_type
+    return "general_error"
 
-def generate_fallback_tts(message: str, voice: str = "en-US-ken", style: str = "Neutral") -> Optional[str]:
-    """Generate fallback TTS audio if Murf is available"""
-    if not murf_client:
+async def cache_fallback_message(error_type: str, message: str, voice: str = "en-US-ken", style: str = "Neutral") -> None:
+    """Make one fallback message available as a static MP3, synthesizing it only if it is not on disk yet"""
+    # Named after its content, so an edited message or voice gets a fresh file
+    filename = hashlib.sha256(f"{voice}|{style}|{message}".encode()).hexdigest()[:16] + ".mp3"
+    path = os.path.join(FALLBACK_AUDIO_DIR, filename)
+    
+    if not os.path.exists(path):
+        if not murf_http_client:
+            return
+        
+        audio_url, error = await safe_generate_tts(message, voice, style)
+        if error:
+            logger.warning("⚠️ Fallback TTS failed for %s: %s", error_type, error)
+            return
+        
+        try:
+            response = await murf_http_client.get(audio_url)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning("⚠️ Fallback audio download failed for %s: %s", error_type, e)
+            return
+        
+        # Written under a per-process temporary name, so a partial file is never served and workers do not collide
+        part_path = f"{path}.{os.getpid()}.part"
+        try:
+            async with aiofiles.open(part_path, "wb") as f:
+                await f.write(response.content)
+            os.replace(part_path, path)
+        except OSError as e:
+            logger.warning("⚠️ Could not save fallback audio for %s: %s", error_type, e)
+            return
+    
+    FALLBACK_AUDIO_URLS[error_type] = f"/static/fallback/{filename}"
+
+async def cache_fallback_audio() -> None:
+    """Synthesize the fallback messages once and keep them under static/, so error responses never call Murf"""
+    await asyncio.gather(*(
+        cache_fallback_message(error_type, message) for error_type, message in FALLBACK_MESSAGES.items()
+    ))
+    build_fallback_responses()
+    logger.info("✅ Fallback audio ready for %s/%s messages", len(FALLBACK_AUDIO_URLS), len(FALLBACK_MESSAGES))
+
+async def prewarm_murf_connection() -> None:
+    """Open a keep-alive connection to Murf so the TTS request that follows skips the TCP/TLS handshake"""
+    if not murf_http_client:
+        return
+    
+    try:
+        # Any response will do, only the pooled connection matters
+        await murf_http_client.head(MURF_BASE_URL)
+    except httpx.HTTPError as e:
+        logger.warning("⚠️ Murf connection prewarm failed: %s", e)
+
+async def cache_get(key: str) -> Optional[str]:
+    """Read a cached value from Redis. Cache failures are treated as misses"""
+    if not redis_client:
         return None
     
     try:
-        response = murf_client.text_to_speech.generate(
-            text=message,
-            voice_id=voice,
-            style=style
-        )
-        
-        if hasattr(response, 'audio_url'):
-            return response.audio_url
-        elif hasattr(response, 'audio_file'):
-            return str(response.audio_file)
-        else:
-            return str(response)
+        value = await redis_client.get(key)
+        return value.decode() if value else None
     except Exception as e:
-        print(f"⚠️ Fallback TTS also failed: {str(e)}")
+        logger.warning("⚠️ Cache read failed: %s", e)
         return None
 
-def safe_transcribe_audio(audio_data: bytes) -> tuple[Optional[str], Optional[str]]:
+async def cache_set(key: str, value: str, ttl: int) -> None:
+    """Write a value to the Redis cache with an expiry. Cache failures are ignored"""
+    if not redis_client:
+        return
+    
+    try:
+        await redis_client.setex(key, ttl, value)
+    except Exception as e:
+        logger.warning("⚠️ Cache write failed: %s", e)
+
+# In-process LRU of LLM answers, keyed by a digest of the prompt (least recently used first)
+llm_local_cache: "OrderedDict[bytes, str]" = OrderedDict()
+
+def remember_llm_response(digest: bytes, response: str) -> None:
+    """Store an answer in the local LRU, evicting the least recently used one when full"""
+    llm_local_cache[digest] = response
+    llm_local_cache.move_to_end(digest)
+    if len(llm_local_cache) > LLM_LOCAL_CACHE_SIZE:
+        llm_local_cache.popitem(last=False)
+
+async def llm_cache_get(prompt_bytes: bytes) -> tuple[bytes, Optional[str]]:
+    """Look an LLM prompt up in the local LRU, then in Redis. Returns (digest, cached response)"""
+    digest = hashlib.blake2b(prompt_bytes, digest_size=16).digest()
+    if (response := llm_local_cache.get(digest)) is not None:
+        llm_local_cache.move_to_end(digest)
+        return digest, response
+    
+    if response := await cache_get("llm:" + digest.hex()):
+        remember_llm_response(digest, response)
+    return digest, response
+
+async def llm_cache_set(digest: bytes, response: str) -> None:
+    """Cache an LLM answer locally and in Redis"""
+    remember_llm_response(digest, response)
+    await cache_set("llm:" + digest.hex(), response, LLM_CACHE_TTL_SECONDS)
+
+def audio_content_type(upload: UploadFile) -> str:
+    """The upload's media type without parameters such as codecs"""
+    return (upload.content_type or "").split(";")[0].strip().lower()
+
+def validate_audio_upload(upload: UploadFile) -> None:
+    """Reject uploads that are not a supported audio format or are too large (the request size is checked earlier by UploadSizeLimitMiddleware)"""
+    if audio_content_type(upload) not in ALLOWED_AUDIO_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid file type. Only audio files are allowed."
+        )
+    
+    if upload.size and upload.size > MAX_AUDIO_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Audio file too large. The limit is {MAX_AUDIO_BYTES // (1024 * 1024)} MB."
+        )
+
+async def iter_upload_chunks(upload: UploadFile, chunk_size: int = UPLOAD_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Yield an uploaded file chunk by chunk so it never has to be held in memory whole"""
+    total_bytes = 0
+    while chunk := await upload.read(chunk_size):
+        # Uploads without a known size are still capped while they are read
+        total_bytes += len(chunk)
+        if total_bytes > MAX_AUDIO_BYTES:
+            raise HTTPException(status_code=413, detail="Audio file too large.")
+        yield chunk
+
+async def decode_to_pcm(audio_data: bytes) -> Optional[bytes]:
+    """Decode any audio format to 16 kHz mono 16-bit PCM with ffmpeg. Returns None if that is not possible"""
+    if not FFMPEG_PATH:
+        return None
+    
+    process = await asyncio.create_subprocess_exec(
+        FFMPEG_PATH, "-loglevel", "error", "-i", "pipe:0", "-t", str(MAX_DECODED_SECONDS),
+        "-ac", "1", "-ar", str(STT_SAMPLE_RATE), "-f", "s16le", "pipe:1",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        pcm, stderr = await asyncio.wait_for(process.communicate(audio_data), FFMPEG_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        logger.warning("⚠️ ffmpeg did not finish within %s seconds", FFMPEG_TIMEOUT_SECONDS)
+        return None
+    finally:
+        # Also reached when the request is cancelled, so ffmpeg is never left running
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+    
+    if process.returncode != 0:
+        logger.warning("⚠️ ffmpeg could not decode the audio: %s", stderr.decode(errors='replace').strip())
+        return None
+    return pcm
+
+def pcm_to_wav(pcm: bytes) -> bytes:
+    """Wrap 16 kHz mono 16-bit PCM in a WAV header so AssemblyAI can identify it"""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(STT_SAMPLE_RATE)
+        wav.writeframes(pcm)
+    return buffer.getvalue()
+
+def split_pcm(pcm: bytes) -> List[memoryview]:
+    """Cut 16 kHz mono PCM into fixed windows that overlap by a second, as views that are only copied when uploaded"""
+    bytes_per_second = STT_SAMPLE_RATE * 2
+    window = STT_CHUNK_SECONDS * bytes_per_second
+    step = (STT_CHUNK_SECONDS - STT_CHUNK_OVERLAP_SECONDS) * bytes_per_second
+    view = memoryview(pcm)
+    return [view[start:start + window] for start in range(0, len(pcm) - STT_CHUNK_OVERLAP_SECONDS * bytes_per_second, step)]
+
+def merge_overlapping_transcripts(texts: List[str]) -> str:
+    """Join window transcripts in order, dropping the words repeated across each overlap"""
+    words: List[str] = []
+    for text in texts:
+        next_words = text.split()
+        normalized_tail = [word.strip(".,!?").lower() for word in words[-MAX_OVERLAP_WORDS:]]
+        normalized_head = [word.strip(".,!?").lower() for word in next_words[:MAX_OVERLAP_WORDS]]
+        
+        overlap = 0
+        for size in range(min(len(normalized_tail), len(normalized_head)), 0, -1):
+            if normalized_tail[-size:] == normalized_head[:size]:
+                overlap = size
+                break
+        words.extend(next_words[overlap:])
+    return " ".join(words)
+
+async def prepare_audio_for_stt(upload: UploadFile) -> Union[bytes, AsyncIterator[bytes], List[memoryview]]:
+    """Downmix an uncompressed upload to 16 kHz mono when that makes it smaller, splitting long recordings into overlapping windows"""
+    if not FFMPEG_PATH or audio_content_type(upload) not in UNCOMPRESSED_AUDIO_TYPES:
+        return iter_upload_chunks(upload)
+    
+    audio_data = b"".join([chunk async for chunk in iter_upload_chunks(upload)])
+    pcm = await decode_to_pcm(audio_data)
+    if pcm is None:
+        return audio_data
+    
+    if len(pcm) > LONG_AUDIO_SECONDS * STT_SAMPLE_RATE * 2:
+        if len(pcm) >= MAX_DECODED_SECONDS * STT_SAMPLE_RATE * 2:
+            logger.warning("⚠️ Recording is longer than %s seconds, only the start is transcribed", MAX_DECODED_SECONDS)
+        return split_pcm(pcm)
+    
+    # 44.1 kHz stereo shrinks several times over, but a FLAC or 16 kHz mono upload may already be as small
+    wav = pcm_to_wav(pcm)
+    return wav if len(wav) < len(audio_data) else audio_data
+
+async def assemblyai_transcribe_windows(windows: List[memoryview]) -> Dict:
+    """Transcribe the windows of a long recording a few at a time and stitch them into one transcript"""
+    semaphore = asyncio.Semaphore(STT_PARALLEL_WINDOWS)
+    
+    async def transcribe_window(window: memoryview) -> Dict:
+        # Wrapped as WAV only once it is its turn, so at most STT_PARALLEL_WINDOWS copies exist at a time
+        async with semaphore:
+            return await assemblyai_transcribe(pcm_to_wav(window))
+    
+    transcripts = await asyncio.gather(*(transcribe_window(window) for window in windows))
+    
+    for transcript in transcripts:
+        if transcript["status"] == "error":
+            return transcript
+    
+    confidences = [t["confidence"] for t in transcripts if t.get("confidence") is not None]
+    return {
+        "status": "completed",
+        "text": merge_overlapping_transcripts([t.get("text") or "" for t in transcripts]),
+        "confidence": sum(confidences) / len(confidences) if confidences else None,
+        "language_code": transcripts[0].get("language_code")
+    }
+
+async def assemblyai_transcribe(audio_data: Union[bytes, AsyncIterator[bytes], List[memoryview]]) -> Dict:
+    """Upload audio to AssemblyAI, submit a transcript and poll until it completes or errors"""
+    if isinstance(audio_data, list):
+        return await assemblyai_transcribe_windows(audio_data)
+    
+    upload_response = await aai_client.post("/upload", content=audio_data)
+    upload_response.raise_for_status()
+    
+    submit_response = await aai_client.post("/transcript", json={"audio_url": upload_response.json()["upload_url"]})
+    submit_response.raise_for_status()
+    transcript_id = submit_response.json()["id"]
+    
+    deadline = asyncio.get_running_loop().time() + TRANSCRIPT_TIMEOUT_SECONDS
+    while True:
+        poll_response = await aai_client.get(f"/transcript/{transcript_id}")
+        poll_response.raise_for_status()
+        transcript = poll_response.json()
+        
+        if transcript["status"] in ("completed", "error"):
+            return transcript
+        if asyncio.get_running_loop().time() > deadline:
+            raise TimeoutError(f"AssemblyAI transcription timed out after {TRANSCRIPT_TIMEOUT_SECONDS} seconds")
+        
+        await asyncio.sleep(TRANSCRIPT_POLL_INTERVAL)
+
+async def safe_transcribe_audio(audio_data: Union[bytes, AsyncIterator[bytes], List[memoryview]]) -> tuple[Optional[str], Optional[str]]:
     """Safely transcribe audio with error handling. Returns (transcript, error_message)"""
-    if not aai_transcriber:
+    if not aai_client:
         return None, "Speech-to-text service is not available"
     
     try:
-        transcript = aai_transcriber.transcribe(audio_data)
+        transcript = await assemblyai_transcribe(audio_data)
         
-        if transcript.status == aai.TranscriptStatus.error:
-            return None, f"Transcription failed: {transcript.error}"
+        if transcript["status"] == "error":
+            return None, f"Transcription failed: {transcript.get('error')}"
         
-        text = transcript.text
+        text = transcript.get("text")
         if not text or len(text.strip()) == 0:
             return None, "No speech detected in the audio"
         
         return text.strip(), None
     except Exception as e:
         error_msg = f"Transcription error: {str(e)}"
-        print(f"❌ {error_msg}")
+        logger.error("❌ %s", error_msg)
         return None, error_msg
 
-def safe_generate_llm_response(prompt: str) -> tuple[Optional[str], Optional[str]]:
-    """Safely generate LLM response. Returns (response, error_message)"""
+transcription_slots = asyncio.Semaphore(TRANSCRIPTION_MAX_CONCURRENT)
+
+async def limited_transcribe_audio(audio_data: Union[bytes, AsyncIterator[bytes], List[memoryview]]) -> tuple[Optional[str], Optional[str]]:
+    """safe_transcribe_audio with at most TRANSCRIPTION_MAX_CONCURRENT chat transcriptions in flight"""
+    async with transcription_slots:
+        return await safe_transcribe_audio(audio_data)
+
+async def safe_generate_llm_response(prompt: str) -> tuple[Optional[str], Optional[str]]:
+    """Safely generate LLM response, reusing cached answers to identical prompts. Returns (response, error_message)"""
     if not gemini_client:
         return None, "AI language model is not available"
     
+    digest, cached_response = await llm_cache_get(prompt.encode())
+    if cached_response:
+        return cached_response, None
+    
     try:
-        llm_response = gemini_client.generate_content(prompt)
+        llm_response = await asyncio.to_thread(gemini_client.generate_content, prompt)
         
         if not llm_response.text:
             return None, "AI did not generate a response"
         
-        return llm_response.text.strip(), None
+        response_text = llm_response.text.strip()
+        await llm_cache_set(digest, response_text)
+        return response_text, None
     except Exception as e:
         error_msg = f"AI response error: {str(e)}"
-        print(f"❌ {error_msg}")
+        logger.error("❌ %s", error_msg)
         return None, error_msg
 
-def safe_generate_tts(text: str, voice: str = "en-US-claire", style: str = "Cheerful") -> tuple[Optional[str], Optional[str]]:
+async def iterate_in_thread(iterable: Iterable) -> AsyncIterator:
+    """Consume a blocking iterator in worker threads, yielding each item on the event loop"""
+    iterator = iter(iterable)
+    done = object()
+    while (item := await asyncio.to_thread(next, iterator, done)) is not done:
+        yield item
+
+def send_chat_message(contents: List[Dict], stream: bool = False):
+    """Start a Gemini chat from the earlier turns and send the newest one (blocking, run it in a thread)"""
+    chat = gemini_chat_model.start_chat(history=contents[:-1])
+    return chat.send_message(contents[-1]["parts"], stream=stream)
+
+async def safe_generate_chat_response(contents: List[Dict]) -> tuple[Optional[str], Optional[str]]:
+    """Safely generate the next chat turn, reusing cached answers to identical conversations. Returns (response, error_message)"""
+    if not gemini_client:
+        return None, "AI language model is not available"
+    
+    digest, cached_response = await llm_cache_get(orjson.dumps(contents))
+    if cached_response:
+        return cached_response, None
+    
+    try:
+        llm_response = await asyncio.to_thread(send_chat_message, contents)
+        
+        if not llm_response.text:
+            return None, "AI did not generate a response"
+        
+        response_text = llm_response.text.strip()
+        await llm_cache_set(digest, response_text)
+        return response_text, None
+    except Exception as e:
+        error_msg = f"AI response error: {str(e)}"
+        logger.error("❌ %s", error_msg)
+        return None, error_msg
+
+async def stream_llm_sentences(contents: List[Dict]) -> AsyncIterator[str]:
+    """Stream the next Gemini chat turn, yielding each complete sentence as soon as it arrives"""
+    llm_response = await asyncio.to_thread(send_chat_message, contents, stream=True)
+    
+    buffer = ""
+    async for chunk in iterate_in_thread(llm_response):
+        buffer += chunk.text
+        # Everything before the last sentence boundary is complete
+        *sentences, buffer = SENTENCE_SPLIT_RE.split(buffer)
+        for sentence in sentences:
+            if sentence.strip():
+                yield sentence.strip()
+    
+    if buffer.strip():
+        yield buffer.strip()
+
+def format_message_time(message: Dict) -> Optional[str]:
+    """ISO 8601 (UTC) time of a stored message; messages keep a float timestamp and are only formatted on output"""
+    if "ts" in message:
+        return datetime.fromtimestamp(message["ts"], timezone.utc).isoformat()
+    # Messages stored before timestamps became floats
+    return message.get("timestamp")
+
+def format_prompt_turn(message: Dict[str, str]) -> Dict:
+    """Convert one chat message to a Gemini conversation turn"""
+    return {"role": "user" if message["role"] == "user" else "model", "parts": [message["content"]]}
+
+def format_turn_text(turn: Dict) -> str:
+    """Render a conversation turn as a plain transcript line"""
+    role_label = "User" if turn["role"] == "user" else "Assistant"
+    return f"{role_label}: {turn['parts'][0]}\n\n"
+
+def build_chat_contents(turns: List[Dict], summary: Optional[str] = None) -> List[Dict]:
+    """Build the Gemini conversation from the summary of older turns and the recent turns, oldest first"""
+    contents = []
+    if summary:
+        contents.append({"role": "user", "parts": [f"Summary of our conversation so far: {summary}"]})
+        contents.append({"role": "model", "parts": ["Got it, I'll keep that in mind."]})
+    
+    for turn in turns:
+        # Gemini expects the roles to alternate, so back-to-back turns from one side are merged
+        if contents and contents[-1]["role"] == turn["role"]:
+            contents[-1] = {"role": turn["role"], "parts": contents[-1]["parts"] + turn["parts"]}
+        else:
+            contents.append(turn)
+    return contents
+
+# Sessions with a summary update in flight, and the tasks running them
+summarizing_sessions: set = set()
+background_tasks: set = set()
+
+async def summarize_session(session_id: str) -> None:
+    """Fold the session's messages that left the verbatim window into its rolling summary"""
+    summary, pending_turns = await chat_store.get_pending_summary(session_id)
+    if len(pending_turns) < SUMMARY_BATCH_MESSAGES:
+        return
+    
+    summary_prompt = (
+        "Summarize the following conversation in at most 200 tokens, keeping names, facts and open questions.\n\n"
+        + (f"Summary so far: {summary}\n\n" if summary else "")
+        + "".join(format_turn_text(turn) for turn in pending_turns)
+    )
+    new_summary, llm_error = await safe_generate_llm_response(summary_prompt)
+    if llm_error:
+        # The turns stay in the conversation verbatim and are retried after the next turn
+        logger.error("🔴 Summary Error for session %s: %s", session_id, llm_error)
+        return
+    
+    if not await chat_store.set_summary(session_id, summary, new_summary.strip(), pending_turns):
+        logger.debug("🗜️ Discarded summary for session %s, it changed while summarizing", session_id)
+        return
+    logger.debug("🗜️ Summarized %s older message(s) for session %s", len(pending_turns), session_id)
+
+def schedule_summary(session_id: str) -> None:
+    """Update the session summary in the background so the reply is not held up"""
+    if session_id in summarizing_sessions:
+        return
+    summarizing_sessions.add(session_id)
+    
+    task = asyncio.create_task(summarize_session(session_id))
+    background_tasks.add(task)
+    
+    def finished(task: asyncio.Task) -> None:
+        background_tasks.discard(task)
+        summarizing_sessions.discard(session_id)
+        if not task.cancelled() and task.exception():
+            logger.error("🔴 Summary Error for session %s: %s", session_id, task.exception())
+    task.add_done_callback(finished)
+
+async def produce_reply_sentences(chat_contents: List[Dict], sentence_queue: asyncio.Queue, sentences: List[str], start_tts: Callable[[str], Any]) -> None:
+    """Stream Gemini's reply into the queue as (sentence, tts) pairs, ending with None"""
+    tts_chars = 0
+    try:
+        async for sentence in stream_llm_sentences(chat_contents):
+            sentences.append(sentence)
+            tts_chars += len(sentence)
+            # Keep the audio within the same length limit as the non-streaming endpoint; once a sentence
+            # overflows it nothing after it is spoken, so the audio never skips a sentence mid-reply
+            await sentence_queue.put((sentence, start_tts(sentence) if tts_chars <= MAX_MURF_CHARS else None))
+    finally:
+        await sentence_queue.put(None)
+
+async def start_streamed_reply(session_id: str, user_message: str, start_tts: Callable[[str], Any]) -> tuple[asyncio.Queue, List[str], asyncio.Task]:
+    """Store the user's message and start streaming the reply to it. Returns (sentence queue, sentences so far, producer task)"""
+    await chat_store.append(session_id, {
+        "role": "user",
+        "content": user_message,
+        "ts": time.time()
+    })
+    summary, turns = await chat_store.get_prompt_context(session_id)
+    
+    sentence_queue: asyncio.Queue = asyncio.Queue()
+    sentences: List[str] = []
+    producer = asyncio.create_task(
+        produce_reply_sentences(build_chat_contents(turns, summary), sentence_queue, sentences, start_tts)
+    )
+    return sentence_queue, sentences, producer
+
+async def save_streamed_reply(session_id: str, sentences: List[str]) -> str:
+    """Store a fully streamed reply in the chat history and return it"""
+    assistant_message = " ".join(sentences)
+    await chat_store.append(session_id, {
+        "role": "assistant",
+        "content": assistant_message,
+        "ts": time.time()
+    })
+    schedule_summary(session_id)
+    return assistant_message
+
+def sse_event(event: str, data: Dict) -> bytes:
+    """Format one server-sent event with a JSON payload"""
+    return f"event: {event}\ndata: ".encode() + orjson.dumps(data) + b"\n\n"
+
+def count_words(text: str) -> int:
+    """Count whitespace-separated words"""
+    return len(text.split())
+
+def find_last_sentence_end(text: str) -> int:
+    """Index of the last '.', '!' or '?' followed by whitespace or the end of the text, or -1"""
+    # Searched backwards with rfind, so the usual case (a sentence end near the end) touches only the tail
+    end = len(text)
+    while end > 0:
+        index = max(text.rfind('.', 0, end), text.rfind('!', 0, end), text.rfind('?', 0, end))
+        if index < 0 or index + 1 == len(text) or text[index + 1].isspace():
+            return index
+        end = index
+    return -1
+
+def extract_audio_url(response) -> str:
+    """Get the audio link from a Murf generate response"""
+    return getattr(response, "audio_url", None) or str(getattr(response, "audio_file", response))
+
+async def safe_generate_tts(text: str, voice: str = "en-US-claire", style: str = "Cheerful") -> tuple[Optional[str], Optional[str]]:
     """Safely generate TTS audio. Returns (audio_url, error_message)"""
     if not murf_client:
         return None, "Text-to-speech service is not available"
     
     try:
-        response = murf_client.text_to_speech.generate(
+        response = await murf_client.text_to_speech.generate(
             text=text,
             voice_id=voice,
             style=style
         )
         
-        audio_url = None
-        if hasattr(response, 'audio_url'):
-            audio_url = response.audio_url
-        elif hasattr(response, 'audio_file'):
-            audio_url = str(response.audio_file)
-        else:
-            audio_url = str(response)
-        
-        return audio_url, None
+        return extract_audio_url(response), None
     except Exception as e:
         error_msg = f"Text-to-speech error: {str(e)}"
-        print(f"❌ {error_msg}")
+        logger.error("❌ %s", error_msg)
         return None, error_msg
 
+async def cached_tts(text: str, voice: str = "en-US-claire", style: str = "Cheerful") -> tuple[Optional[str], Optional[str]]:
+    """safe_generate_tts backed by a Redis cache keyed on (voice, style, text). Returns (audio_url, error_message)"""
+    key = "tts:" + hashlib.sha256(f"{voice}|{style}|{text}".encode()).hexdigest()
+    if audio_url := await cache_get(key):
+        return audio_url, None
+    
+    audio_url, error = await safe_generate_tts(text, voice, style)
+    if audio_url:
+        await cache_set(key, audio_url, TTS_CACHE_TTL_SECONDS)
+    return audio_url, error
+
+async def stream_tts_audio(text: str, voice: str = "en-US-claire", style: str = "Cheerful") -> AsyncIterator[bytes]:
+    """Yield MP3 audio from Murf's streaming endpoint as it is synthesized"""
+    async for chunk in murf_client.text_to_speech.stream(text=text, voice_id=voice, style=style, format="MP3"):
+        yield chunk
+
+async def stream_fallback_audio(error_type: str) -> AsyncIterator[bytes]:
+    """Yield the cached MP3 of a fallback message, asking Murf for it only if it was never saved"""
+    audio_url = FALLBACK_AUDIO_URLS.get(error_type)
+    path = os.path.join(FALLBACK_AUDIO_DIR, os.path.basename(audio_url)) if audio_url else None
+    if path and os.path.exists(path):
+        async with aiofiles.open(path, "rb") as f:
+            while chunk := await f.read(UPLOAD_CHUNK_SIZE):
+                yield chunk
+        return
+    
+    async for chunk in stream_tts_audio(FALLBACK_MESSAGES[error_type], "en-US-ken", "Neutral"):
+        yield chunk
+
+def split_text_for_tts(text: str, max_chars: int = TTS_SEGMENT_CHARS) -> List[str]:
+    """Group whole sentences into segments of at most max_chars (a longer sentence becomes its own segment)"""
+    segments = []
+    current = ""
+    
+    for sentence in SENTENCE_SPLIT_RE.split(text.strip()):
+        if not sentence:
+            continue
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            segments.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    
+    if current:
+        segments.append(current)
+    
+    return segments
+
+async def safe_generate_tts_segments(text: str, voice: str = "en-US-claire", style: str = "Cheerful") -> tuple[Optional[List[str]], Optional[str]]:
+    """Synthesize long text as sentence segments concurrently. Returns (audio_urls in playback order, error_message)"""
+    segments = split_text_for_tts(text)
+    if not segments:
+        return None, "No text to synthesize"
+    
+    results = await asyncio.gather(*[cached_tts(segment, voice, style) for segment in segments])
+    
+    for _, error in results:
+        if error:
+            return None, error
+    
+    return [audio_url for audio_url, _ in results], None
+
+class UploadSizeLimitMiddleware:
+    """Reject oversized multipart (audio upload) requests before Starlette receives and spools the form"""
+    
+    def __init__(self, app: ASGIApp, max_bytes: int = MAX_UPLOAD_REQUEST_BYTES):
+        self.app = app
+        self.max_bytes = max_bytes
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        headers = Headers(scope=scope)
+        if not headers.get("content-type", "").startswith("multipart/form-data"):
+            await self.app(scope, receive, send)
+            return
+        
+        content_length = headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > self.max_bytes:
+            response = ORJSONResponse(
+                {"detail": f"Audio file too large. The limit is {MAX_AUDIO_BYTES // (1024 * 1024)} MB."},
+                status_code=413
+            )
+            await response(scope, receive, send)
+            return
+        
+        # Chunked requests carry no Content-Length, so their body is counted as it arrives
+        received_bytes = 0
+        
+        async def limited_receive():
+            nonlocal received_bytes
+            message = await receive()
+            received_bytes += len(message.get("body", b""))
+            if received_bytes > self.max_bytes:
+                raise HTTPException(status_code=413, detail="Audio file too large.")
+            return message
+        
+        await self.app(scope, limited_receive, send)
+
+# Cap upload sizes; added first so CORS headers are still set on the 413 response
+app.add_middleware(UploadSizeLimitMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -152,37 +823,326 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress text responses (chat replies, HTML pages); server-sent event streams are left uncompressed
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Mount static files directory
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
+# One HTTP/2 connection pool shared by the Murf and AssemblyAI clients, so connections are reused across both
+SHARED_HTTP_TRANSPORT = httpx.AsyncHTTPTransport(
+    http2=True,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+)
+
 # Initialize Murf client
 MURF_API_KEY = os.getenv("MURF_API_KEY")
+MURF_BASE_URL = "https://api.murf.ai"
 if not MURF_API_KEY:
-    print("⚠️ Warning: MURF_API_KEY not found in environment variables!")
+    logger.warning("⚠️ Warning: MURF_API_KEY not found in environment variables!")
+    murf_http_client = None
     murf_client = None
 else:
-    murf_client = Murf(api_key=MURF_API_KEY)
-    print("✅ Murf client initialized successfully!")
+    murf_http_client = httpx.AsyncClient(transport=SHARED_HTTP_TRANSPORT, timeout=60, follow_redirects=True)
+    murf_client = AsyncMurf(api_key=MURF_API_KEY, httpx_client=murf_http_client)
+    logger.info("✅ Murf client initialized successfully!")
 
 # Initialize AssemblyAI client
 ASSEMBLYAI_API_KEY = os.getenv("ASSEMBLYAI_API_KEY")
 if not ASSEMBLYAI_API_KEY:
-    print("⚠️ Warning: ASSEMBLYAI_API_KEY not found in environment variables!")
-    aai_transcriber = None
+    logger.warning("⚠️ Warning: ASSEMBLYAI_API_KEY not found in environment variables!")
+    aai_client = None
 else:
-    aai.settings.api_key = ASSEMBLYAI_API_KEY
-    aai_transcriber = aai.Transcriber()
-    print("✅ AssemblyAI client initialized successfully!")
+    aai_client = httpx.AsyncClient(
+        base_url=ASSEMBLYAI_BASE_URL,
+        headers={"authorization": ASSEMBLYAI_API_KEY},
+        transport=SHARED_HTTP_TRANSPORT,
+        timeout=60
+    )
+    logger.info("✅ AssemblyAI client initialized successfully!")
 
 # Initialize Google Gemini client
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 if not GEMINI_API_KEY:
-    print("⚠️ Warning: GEMINI_API_KEY not found in environment variables!")
+    logger.warning("⚠️ Warning: GEMINI_API_KEY not found in environment variables!")
     gemini_client = None
+    gemini_chat_model = None
 else:
     genai.configure(api_key=GEMINI_API_KEY)
     gemini_client = genai.GenerativeModel('gemini-2.0-flash')
-    print("✅ Google Gemini client initialized successfully!")
+    # Chat endpoints send structured turns under a fixed system instruction instead of one flattened prompt
+    gemini_chat_model = genai.GenerativeModel('gemini-2.0-flash', system_instruction=SYSTEM_PROMPT)
+    logger.info("✅ Google Gemini client initialized successfully!")
+
+# Initialize Redis for chat history shared across workers
+REDIS_URL = os.getenv("REDIS_URL")
+if not REDIS_URL:
+    logger.warning("⚠️ Warning: REDIS_URL not found, chat history will be kept in process memory!")
+    redis_client = None
+else:
+    redis_client = redis.Redis.from_url(REDIS_URL)
+    logger.info("✅ Redis client initialized successfully!")
+
+# Chat history storage (session_id -> messages, oldest first)
+class InMemorySession:
+    """One session's messages plus their Gemini turns, converted once when each message is added"""
+    
+    def __init__(self):
+        # Oldest messages are evicted as new ones are appended once the history is full
+        self.messages: deque = deque(maxlen=MAX_HISTORY_MESSAGES * 2)
+        # Only the verbatim window is kept, older turns move to the pending list as new ones are appended
+        self.prompt_turns: deque = deque(maxlen=SUMMARY_KEEP_MESSAGES)
+        # Turns that left the window but are not yet part of the summary (capped if summaries keep failing)
+        self.pending_turns: deque = deque(maxlen=MAX_HISTORY_MESSAGES)
+        self.summary: Optional[str] = None
+
+class InMemoryChatStore:
+    """Chat history kept in this process; lost on restart and not shared between workers"""
+    
+    def __init__(self):
+        # Bounded in sessions as well as messages, idle sessions expire like their Redis counterparts
+        self.sessions: TTLCache = TTLCache(maxsize=MAX_SESSIONS, ttl=SESSION_TTL_SECONDS)
+    
+    async def get_messages(self, session_id: str) -> List[Dict[str, str]]:
+        session = self.sessions.get(session_id)
+        return list(session.messages) if session else []
+    
+    async def get_prompt_context(self, session_id: str) -> tuple[Optional[str], List[Dict]]:
+        """Return the rolling summary and the conversation turns not yet covered by it"""
+        session = self.sessions.get(session_id)
+        if session is None:
+            return None, []
+        return session.summary, [*session.pending_turns, *session.prompt_turns]
+    
+    async def get_pending_summary(self, session_id: str) -> tuple[Optional[str], List[Dict]]:
+        """Return the rolling summary and the turns waiting to be folded into it"""
+        session = self.sessions.get(session_id)
+        if session is None:
+            return None, []
+        return session.summary, list(session.pending_turns)
+    
+    async def set_summary(self, session_id: str, previous_summary: Optional[str], summary: str, summarized_turns: List[Dict]) -> bool:
+        """Store a new summary and drop the pending turns it covers, unless the session changed since they were read"""
+        session = self.sessions.get(session_id)
+        # A cleared (or recreated) session or a summary written meanwhile means these turns are stale
+        if (
+            session is None
+            or session.summary != previous_summary
+            or list(islice(session.pending_turns, len(summarized_turns))) != summarized_turns
+        ):
+            return False
+        session.summary = summary
+        for _ in range(len(summarized_turns)):
+            session.pending_turns.popleft()
+        return True
+    
+    async def append(self, session_id: str, message: Dict[str, str]) -> None:
+        session = self.sessions.get(session_id) or InMemorySession()
+        session.messages.append(message)
+        if len(session.prompt_turns) == session.prompt_turns.maxlen:
+            session.pending_turns.append(session.prompt_turns[0])
+        session.prompt_turns.append(format_prompt_turn(message))
+        
+        # Re-inserting the session refreshes its expiry
+        self.sessions[session_id] = session
+    
+    async def count(self, session_id: str) -> int:
+        session = self.sessions.get(session_id)
+        return len(session.messages) if session else 0
+    
+    async def clear(self, session_id: str) -> int:
+        """Delete a session, returning how many messages it held"""
+        session = self.sessions.pop(session_id, None)
+        return len(session.messages) if session else 0
+    
+    async def stats(self) -> Dict:
+        """Session and message totals for /health, counted in memory without touching any message"""
+        return {
+            "active_sessions": len(self.sessions),
+            "total_messages": sum(len(session.messages) for session in self.sessions.values())
+        }
+    
+    async def list_sessions(self) -> List[Dict]:
+        return [
+            {
+                "session_id": session_id,
+                "message_count": len(session.messages),
+                "last_message_time": format_message_time(session.messages[-1]),
+                "first_message_time": format_message_time(session.messages[0])
+            }
+            for session_id, session in self.sessions.items() if session.messages
+        ]
+
+class RedisChatStore:
+    """Chat history kept in Redis as capped, expiring lists (oldest message first)"""
+    
+    def __init__(self, client: "redis.Redis"):
+        self.client = client
+    
+    @staticmethod
+    def _key(session_id: str) -> str:
+        return f"chat:{session_id}"
+    
+    # Kept outside the chat:* namespace so session listing only sees message lists
+    @staticmethod
+    def _summary_key(session_id: str) -> str:
+        return f"chat-summary:{session_id}"
+    
+    @staticmethod
+    def _pending_key(session_id: str) -> str:
+        return f"chat-pending:{session_id}"
+    
+    async def get_messages(self, session_id: str) -> List[Dict[str, str]]:
+        raw_messages = await self.client.lrange(self._key(session_id), 0, -1)
+        return [orjson.loads(raw) for raw in raw_messages]
+    
+    async def get_prompt_context(self, session_id: str) -> tuple[Optional[str], List[Dict]]:
+        """Return the rolling summary and the conversation turns not yet covered by it"""
+        summary, pending_turns, raw_messages = await (
+            self.client.pipeline()
+            .get(self._summary_key(session_id))
+            .lrange(self._pending_key(session_id), 0, -1)
+            .lrange(self._key(session_id), -SUMMARY_KEEP_MESSAGES, -1)
+            .execute()
+        )
+        turns = [orjson.loads(raw) for raw in pending_turns]
+        turns += [format_prompt_turn(orjson.loads(raw)) for raw in raw_messages]
+        return (summary.decode() if summary else None), turns
+    
+    async def get_pending_summary(self, session_id: str) -> tuple[Optional[str], List[Dict]]:
+        """Return the rolling summary and the turns waiting to be folded into it"""
+        summary, pending_turns = await (
+            self.client.pipeline()
+            .get(self._summary_key(session_id))
+            .lrange(self._pending_key(session_id), 0, -1)
+            .execute()
+        )
+        return (summary.decode() if summary else None), [orjson.loads(raw) for raw in pending_turns]
+    
+    async def set_summary(self, session_id: str, previous_summary: Optional[str], summary: str, summarized_turns: List[Dict]) -> bool:
+        """Store a new summary and drop the pending turns it covers, unless the session changed since they were read"""
+        summary_key = self._summary_key(session_id)
+        pending_key = self._pending_key(session_id)
+        
+        # WATCH makes the check and the write one transaction across workers; a concurrent change is re-checked
+        async with self.client.pipeline() as pipe:
+            for _ in range(3):
+                try:
+                    await pipe.watch(summary_key, pending_key)
+                    exists = await pipe.exists(self._key(session_id))
+                    current_summary = await pipe.get(summary_key)
+                    pending_turns = await pipe.lrange(pending_key, 0, len(summarized_turns) - 1)
+                    # A cleared session or another worker's summary means these turns are stale
+                    if (
+                        not exists
+                        or (current_summary.decode() if current_summary else None) != previous_summary
+                        or [orjson.loads(raw) for raw in pending_turns] != summarized_turns
+                    ):
+                        await pipe.unwatch()
+                        return False
+                    
+                    pipe.multi()
+                    pipe.set(summary_key, summary, ex=SESSION_TTL_SECONDS)
+                    pipe.ltrim(pending_key, len(summarized_turns), -1)
+                    await pipe.execute()
+                    return True
+                except redis.WatchError:
+                    continue
+        return False
+    
+    async def append(self, session_id: str, message: Dict[str, str]) -> None:
+        key = self._key(session_id)
+        pending_key = self._pending_key(session_id)
+        # After the push, the element just before the last SUMMARY_KEEP_MESSAGES has left the verbatim window
+        _, evicted, *_ = await (
+            self.client.pipeline()
+            .rpush(key, orjson.dumps(message))
+            .lindex(key, -SUMMARY_KEEP_MESSAGES - 1)
+            .ltrim(key, -MAX_HISTORY_MESSAGES * 2, -1)
+            .expire(key, SESSION_TTL_SECONDS)
+            .expire(self._summary_key(session_id), SESSION_TTL_SECONDS)
+            .execute()
+        )
+        if evicted:
+            await (
+                self.client.pipeline()
+                .rpush(pending_key, orjson.dumps(format_prompt_turn(orjson.loads(evicted))))
+                .ltrim(pending_key, -MAX_HISTORY_MESSAGES, -1)
+                .expire(pending_key, SESSION_TTL_SECONDS)
+                .execute()
+            )
+    
+    async def count(self, session_id: str) -> int:
+        return await self.client.llen(self._key(session_id))
+    
+    async def clear(self, session_id: str) -> int:
+        """Delete a session, returning how many messages it held"""
+        key = self._key(session_id)
+        message_count, _ = await (
+            self.client.pipeline()
+            .llen(key)
+            .delete(key, self._summary_key(session_id), self._pending_key(session_id))
+            .execute()
+        )
+        return message_count
+    
+    async def stats(self) -> Dict:
+        """Reachability for /health; totals would need a scan of the whole keyspace, so they are not counted"""
+        await self.client.ping()
+        return {"active_sessions": None, "total_messages": None}
+    
+    async def list_sessions(self) -> List[Dict]:
+        keys = [key async for key in self.client.scan_iter(match="chat:*")]
+        if not keys:
+            return []
+        
+        pipe = self.client.pipeline()
+        for key in keys:
+            pipe.llen(key).lindex(key, -1).lindex(key, 0)
+        results = await pipe.execute()
+        
+        sessions = []
+        for i, key in enumerate(keys):
+            message_count, newest, oldest = results[i * 3:i * 3 + 3]
+            if message_count:
+                sessions.append({
+                    "session_id": key.decode().removeprefix("chat:"),
+                    "message_count": message_count,
+                    "last_message_time": format_message_time(orjson.loads(newest)),
+                    "first_message_time": format_message_time(orjson.loads(oldest))
+                })
+        return sessions
+
+chat_store = RedisChatStore(redis_client) if redis_client else InMemoryChatStore()
+
+# Main page template, read once at startup: the chat template first, then the LLM and original templates as fallbacks
+INDEX_TEMPLATES = ["templates/chat.html", "templates/index_llm.html", "templates/index.html"]
+
+def load_index_html() -> str:
+    """Return the first available page template"""
+    for template_path in INDEX_TEMPLATES:
+        try:
+            with open(template_path, "r", encoding="utf-8") as file:
+                return file.read()
+        except FileNotFoundError:
+            continue
+    return "<h1>AI Chat Assistant</h1><p>Template not found, but API is working at /docs</p>"
+
+INDEX_HTML = load_index_html()
+
+# Popular Murf voice options served by /tts/voices
+VOICES_PAYLOAD = {
+    "message": "Popular Murf voices",
+    "voices": [
+        {"id": "en-US-ken", "name": "Ken", "language": "English (US)", "gender": "male"},
+        {"id": "en-US-sarah", "name": "Sarah", "language": "English (US)", "gender": "female"},
+        {"id": "en-US-marcus", "name": "Marcus", "language": "English (US)", "gender": "male"},
+        {"id": "en-UK-charlie", "name": "Charlie", "language": "English (UK)", "gender": "male"},
+        {"id": "en-US-claire", "name": "Claire", "language": "English (US)", "gender": "female"}
+    ],
+    "styles": ["Neutral", "Cheerful", "Angry", "Sad", "Excited", "Whispering"]
+}
+VOICES_JSON = orjson.dumps(VOICES_PAYLOAD)
 
 # Pydantic models for request/response
 class TTSRequest(BaseModel):
@@ -228,7 +1188,8 @@ class ChatMessage(BaseModel):
 class ChatResponse(BaseModel):
     success: bool
     message: str
-    audio_url: Optional[str] = None
+    audio_url: Optional[str] = None  # First TTS segment only (or the fallback audio)
+    audio_urls: Optional[List[str]] = None  # All TTS segments in playback order
     transcript: Optional[str] = None
     llm_response: Optional[str] = None
     session_id: str
@@ -236,6 +1197,26 @@ class ChatResponse(BaseModel):
     error_type: Optional[str] = None
     fallback_used: Optional[bool] = False
 
+# Chat responses for each fallback, cloned with the session fields filled in when a step fails
+FALLBACK_RESPONSES: Dict[str, ChatResponse] = {}
+
+def build_fallback_responses() -> None:
+    """(Re)build the fallback chat responses, picking up whatever fallback audio is available"""
+    for error_type, fallback_message in FALLBACK_MESSAGES.items():
+        FALLBACK_RESPONSES[error_type] = ChatResponse(
+            success=False,
+            message=fallback_message,
+            audio_url=FALLBACK_AUDIO_URLS.get(error_type),
+            transcript=None,
+            llm_response=fallback_message,
+            session_id="",
+            message_count=0,
+            error_type=error_type,
+            fallback_used=True
+        )
+
+build_fallback_responses()
+
 class ErrorResponse(BaseModel):
     success: bool = False
     error_type: str
@@ -247,28 +1228,7 @@ class ErrorResponse(BaseModel):
 @app.get("/", response_class=HTMLResponse)
 async def read_root():
     """Serve the main AI Chat Assistant page with conversation memory"""
-    try:
-        # Try to load the new chat template first
-        with open("templates/chat.html", "r", encoding="utf-8") as file:
-            html_content = file.read()
-        return HTMLResponse(content=html_content, status_code=200)
-    except FileNotFoundError:
-        try:
-            # Try the LLM template as fallback
-            with open("templates/index_llm.html", "r", encoding="utf-8") as file:
-                html_content = file.read()
-            return HTMLResponse(content=html_content, status_code=200)
-        except FileNotFoundError:
-            try:
-                # Fallback to original template if others don't exist
-                with open("templates/index.html", "r", encoding="utf-8") as file:
-                    html_content = file.read()
-                return HTMLResponse(content=html_content, status_code=200)
-            except FileNotFoundError:
-                return HTMLResponse(
-                    content="<h1>AI Chat Assistant</h1><p>Template not found, but API is working at /docs</p>", 
-                    status_code=200
-                )
+    return HTMLResponse(content=INDEX_HTML, status_code=200)
 
 @app.post("/tts/generate", response_model=TTSResponse, summary="Generate TTS Audio", description="Convert text to speech using Murf Python SDK")
 async def generate_tts(request: TTSRequest):
@@ -301,39 +1261,32 @@ async def generate_tts(request: TTSRequest):
         )
     
     try:
-        print(f"🎤 Generating TTS for: '{request.text[:50]}...'")
-        print(f"🗣️ Voice: {request.voice_id}, Style: {request.style}")
-        
-        # Use Murf SDK to generate speech
-        response = murf_client.text_to_speech.generate(
-            text=request.text.strip(),
-            voice_id=request.voice_id,
-            style=request.style
-        )
+        logger.debug("🎤 Generating TTS for: '%s...'", request.text[:50])
+        logger.debug("🗣️ Voice: %s, Style: %s", request.voice_id, request.style)
         
-        # Extract audio URL from response
-        audio_url = None
-        if hasattr(response, 'audio_url'):
-            audio_url = response.audio_url
-        elif hasattr(response, 'audio_file'):
-            audio_url = str(response.audio_file)
-        else:
-            # Try to get URL from response object
-            audio_url = str(response)
+        # Use Murf SDK to generate speech (served from cache for repeated requests)
+        audio_url, tts_error = await cached_tts(request.text.strip(), request.voice_id, request.style)
+        if tts_error:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Failed to generate speech: {tts_error}"
+            )
         
-        print(f"✅ TTS generated successfully! Audio URL: {audio_url}")
+        logger.debug("✅ TTS generated successfully! Audio URL: %s", audio_url)
         
         # Return success response
         return TTSResponse(
             success=True,
             message="TTS generation successful!",
             audio_url=audio_url,
-            audio_file=str(response.audio_file) if hasattr(response, 'audio_file') else audio_url,
-            word_count=len(request.text.split())
+            audio_file=audio_url,
+            word_count=count_words(request.text)
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"❌ Murf SDK error: {str(e)}")
+        logger.error("❌ Murf SDK error: %s", e)
         # Handle any errors from the Murf SDK
         raise HTTPException(
             status_code=500,
@@ -345,18 +1298,8 @@ async def list_voices():
     """
     Get list of popular TTS voices available in Murf
     """
-    # Return some popular voice options
-    return {
-        "message": "Popular Murf voices",
-        "voices": [
-            {"id": "en-US-ken", "name": "Ken", "language": "English (US)", "gender": "male"},
-            {"id": "en-US-sarah", "name": "Sarah", "language": "English (US)", "gender": "female"},
-            {"id": "en-US-marcus", "name": "Marcus", "language": "English (US)", "gender": "male"},
-            {"id": "en-UK-charlie", "name": "Charlie", "language": "English (UK)", "gender": "male"},
-            {"id": "en-US-claire", "name": "Claire", "language": "English (US)", "gender": "female"}
-        ],
-        "styles": ["Neutral", "Cheerful", "Angry", "Sad", "Excited", "Whispering"]
-    }
+    # The list is static, so it is serialized once at startup
+    return Response(content=VOICES_JSON, media_type="application/json")
 
 @app.post("/audio/upload", response_model=AudioUploadResponse, summary="Upload Audio File", description="Upload recorded audio file to server")
 async def upload_audio(audio_file: UploadFile = File(...)):
@@ -368,33 +1311,32 @@ async def upload_audio(audio_file: UploadFile = File(...)):
     
     try:
         # Validate file type
-        if not audio_file.content_type or not audio_file.content_type.startswith('audio/'):
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid file type. Only audio files are allowed."
-            )
-        
-        # Create uploads directory if it doesn't exist
-        uploads_dir = "uploads"
-        os.makedirs(uploads_dir, exist_ok=True)
+        validate_audio_upload(audio_file)
         
         # Generate unique filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         file_extension = audio_file.filename.split('.')[-1] if '.' in audio_file.filename else 'wav'
         unique_filename = f"recording_{timestamp}.{file_extension}"
-        file_path = os.path.join(uploads_dir, unique_filename)
+        file_path = os.path.join(UPLOADS_DIR, unique_filename)
         
-        # Save the file
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(audio_file.file, buffer)
-        
-        # Get file size
-        file_size = os.path.getsize(file_path)
-        
-        print(f"🎵 Audio file uploaded successfully!")
-        print(f"📁 Filename: {unique_filename}")
-        print(f"📊 Size: {file_size} bytes")
-        print(f"🎧 Content Type: {audio_file.content_type}")
+        # Save the file, counting its size as it is written
+        file_size = 0
+        try:
+            async with aiofiles.open(file_path, "wb") as buffer:
+                async for chunk in iter_upload_chunks(audio_file):
+                    await buffer.write(chunk)
+                    file_size += len(chunk)
+        except Exception:
+            # Don't leave a partial recording behind when the upload is too large or the write fails
+            # The file may not exist if opening it was what failed
+            with suppress(FileNotFoundError):
+                os.remove(file_path)
+            raise
+        
+        logger.debug("🎵 Audio file uploaded successfully!")
+        logger.debug("📁 Filename: %s", unique_filename)
+        logger.debug("📊 Size: %s bytes", file_size)
+        logger.debug("🎧 Content Type: %s", audio_file.content_type)
         
         # Return success response
         return AudioUploadResponse(
@@ -405,8 +1347,10 @@ async def upload_audio(audio_file: UploadFile = File(...)):
             size=file_size
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"❌ Audio upload error: {str(e)}")
+        logger.error("❌ Audio upload error: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to upload audio file: {str(e)}"
@@ -422,53 +1366,48 @@ async def transcribe_audio(audio_file: UploadFile = File(...)):
     
     try:
         # Check if AssemblyAI is configured
-        if not aai_transcriber:
+        if not aai_client:
             raise HTTPException(
                 status_code=500,
                 detail="ASSEMBLYAI_API_KEY not found in environment variables. Please add it to your .env file."
             )
         
         # Validate file type
-        if not audio_file.content_type or not audio_file.content_type.startswith('audio/'):
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid file type. Only audio files are allowed."
-            )
+        validate_audio_upload(audio_file)
         
-        print(f"🎤 Starting transcription for: {audio_file.filename}")
-        print(f"🎧 Content Type: {audio_file.content_type}")
+        logger.debug("🎤 Starting transcription for: %s", audio_file.filename)
+        logger.debug("🎧 Content Type: %s", audio_file.content_type)
         
-        # Read audio file data
-        audio_data = await audio_file.read()
-        print(f"📊 Audio data size: {len(audio_data)} bytes")
+        logger.debug("📊 Audio data size: %s bytes", audio_file.size)
         
-        # Transcribe using AssemblyAI
-        transcript = aai_transcriber.transcribe(audio_data)
+        # Transcribe using AssemblyAI, streaming the upload
+        transcript = await assemblyai_transcribe(await prepare_audio_for_stt(audio_file))
         
         # Check if transcription was successful
-        if transcript.status == aai.TranscriptStatus.error:
+        if transcript["status"] == "error":
             raise HTTPException(
                 status_code=500,
-                detail=f"Transcription failed: {transcript.error}"
+                detail=f"Transcription failed: {transcript.get('error')}"
             )
         
-        print(f"✅ Transcription completed successfully!")
-        print(f"📝 Transcript: {transcript.text[:100]}...")
-        print(f"🎯 Confidence: {transcript.confidence}")
+        transcript_text = transcript.get("text") or ""
+        logger.debug("✅ Transcription completed successfully!")
+        logger.debug("📝 Transcript: %s...", transcript_text[:100])
+        logger.debug("🎯 Confidence: %s", transcript.get('confidence'))
         
         # Return success response
         return TranscriptionResponse(
             success=True,
             message="Audio transcription completed successfully!",
-            transcript=transcript.text,
-            confidence=transcript.confidence,
-            language_detected=transcript.language_code if hasattr(transcript, 'language_code') else None
+            transcript=transcript.get("text"),
+            confidence=transcript.get("confidence"),
+            language_detected=transcript.get("language_code")
         )
         
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Transcription error: {str(e)}")
+        logger.error("❌ Transcription error: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to transcribe audio: {str(e)}"
@@ -484,7 +1423,7 @@ async def echo_with_murf(audio_file: UploadFile = File(...)):
     
     try:
         # Check if both APIs are configured
-        if not aai_transcriber:
+        if not aai_client:
             raise HTTPException(
                 status_code=500,
                 detail="ASSEMBLYAI_API_KEY not found in environment variables. Please add it to your .env file."
@@ -497,30 +1436,25 @@ async def echo_with_murf(audio_file: UploadFile = File(...)):
             )
         
         # Validate file type
-        if not audio_file.content_type or not audio_file.content_type.startswith('audio/'):
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid file type. Only audio files are allowed."
-            )
+        validate_audio_upload(audio_file)
         
-        print(f"🎤 Echo Bot: Processing {audio_file.filename}")
-        print(f"🎧 Content Type: {audio_file.content_type}")
+        logger.debug("🎤 Echo Bot: Processing %s", audio_file.filename)
+        logger.debug("🎧 Content Type: %s", audio_file.content_type)
         
-        # Step 1: Read and transcribe audio
-        audio_data = await audio_file.read()
-        print(f"📊 Audio data size: {len(audio_data)} bytes")
+        # Step 1: Transcribe audio
+        logger.debug("📊 Audio data size: %s bytes", audio_file.size)
         
-        print("📝 Transcribing audio with AssemblyAI...")
-        transcript = aai_transcriber.transcribe(audio_data)
+        logger.debug("📝 Transcribing audio with AssemblyAI...")
+        transcript = await assemblyai_transcribe(await prepare_audio_for_stt(audio_file))
         
         # Check if transcription was successful
-        if transcript.status == aai.TranscriptStatus.error:
+        if transcript["status"] == "error":
             raise HTTPException(
                 status_code=500,
-                detail=f"Transcription failed: {transcript.error}"
+                detail=f"Transcription failed: {transcript.get('error')}"
             )
         
-        transcribed_text = transcript.text
+        transcribed_text = transcript.get("text")
         if not transcribed_text or len(transcribed_text.strip()) == 0:
             raise HTTPException(
                 status_code=400,
@@ -530,47 +1464,39 @@ async def echo_with_murf(audio_file: UploadFile = File(...)):
         # Clean up the transcribed text
         transcribed_text = transcribed_text.strip()
         
-        print(f"✅ Transcription successful: {transcribed_text[:100]}...")
-        print(f"🎯 Confidence: {transcript.confidence}")
+        logger.debug("✅ Transcription successful: %s...", transcribed_text[:100])
+        logger.debug("🎯 Confidence: %s", transcript.get('confidence'))
         
         # Step 2: Generate speech with Murf using the transcribed text
         # Using a different voice for variety - you can change this
         murf_voice = "en-US-natalie"  # Female voice for contrast
         murf_style = "Neutral"  # Using Neutral style as it's more reliable
         
-        print(f"🎤 Generating speech with Murf voice: {murf_voice}")
-        print(f"🗣️ Style: {murf_style}")
+        logger.debug("🎤 Generating speech with Murf voice: %s", murf_voice)
+        logger.debug("🗣️ Style: %s", murf_style)
         
-        response = murf_client.text_to_speech.generate(
-            text=transcribed_text,
-            voice_id=murf_voice,
-            style=murf_style
-        )
-        
-        # Extract audio URL from response
-        audio_url = None
-        if hasattr(response, 'audio_url'):
-            audio_url = response.audio_url
-        elif hasattr(response, 'audio_file'):
-            audio_url = str(response.audio_file)
-        else:
-            audio_url = str(response)
+        audio_url, tts_error = await cached_tts(transcribed_text, murf_voice, murf_style)
+        if tts_error:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Failed to process echo: {tts_error}"
+            )
         
-        print(f"✅ Murf audio generated successfully! URL: {audio_url}")
+        logger.debug("✅ Murf audio generated successfully! URL: %s", audio_url)
         
         # Return success response with both transcript and audio URL
         return TTSResponse(
             success=True,
             message=f"Echo generated with Murf voice! Transcript: {transcribed_text}",
             audio_url=audio_url,
-            audio_file=str(response.audio_file) if hasattr(response, 'audio_file') else audio_url,
-            word_count=len(transcribed_text.split())
+            audio_file=audio_url,
+            word_count=count_words(transcribed_text)
         )
         
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Echo Bot error: {str(e)}")
+        logger.error("❌ Echo Bot error: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to process echo: {str(e)}"
@@ -612,40 +1538,35 @@ async def query_llm(
         if audio_file:
             # Handle audio file upload
             # Check if AssemblyAI is configured for transcription
-            if not aai_transcriber:
+            if not aai_client:
                 raise HTTPException(
                     status_code=500,
                     detail="ASSEMBLYAI_API_KEY not found in environment variables. Please add it to your .env file."
                 )
             
             # Validate audio file type
-            if not audio_file.content_type or not audio_file.content_type.startswith('audio/'):
-                raise HTTPException(
-                    status_code=400,
-                    detail="Invalid file type. Only audio files are allowed."
-                )
+            validate_audio_upload(audio_file)
             
-            print(f"🎤 Transcribing audio for LLM query: {audio_file.filename}")
+            logger.debug("🎤 Transcribing audio for LLM query: %s", audio_file.filename)
             
             # Transcribe the audio
-            audio_data = await audio_file.read()
-            transcript = aai_transcriber.transcribe(audio_data)
+            transcript = await assemblyai_transcribe(await prepare_audio_for_stt(audio_file))
             
             # Check if transcription was successful
-            if transcript.status == aai.TranscriptStatus.error:
+            if transcript["status"] == "error":
                 raise HTTPException(
                     status_code=500,
-                    detail=f"Transcription failed: {transcript.error}"
+                    detail=f"Transcription failed: {transcript.get('error')}"
                 )
             
-            query_text = transcript.text
+            query_text = transcript.get("text")
             if not query_text or len(query_text.strip()) == 0:
                 raise HTTPException(
                     status_code=400,
                     detail="No speech detected in the audio. Please record clear audio with speech."
                 )
             
-            print(f"✅ Transcription successful: {query_text[:100]}...")
+            logger.debug("✅ Transcription successful: %s...", query_text[:100])
             
         elif "application/json" in content_type:
             # Handle JSON request
@@ -680,36 +1601,29 @@ async def query_llm(
             )
         
         # Step 2: Send query to Gemini LLM
-        print(f"🤖 Sending query to Gemini: '{query_text[:50]}...'")
+        logger.debug("🤖 Sending query to Gemini: '%s...'", query_text[:50])
         
-        llm_response = gemini_client.generate_content(query_text)
+        llm_text, llm_error = await safe_generate_llm_response(query_text)
         
         # Check if response was generated successfully
-        if not llm_response.text:
+        if llm_error:
             raise HTTPException(
                 status_code=500,
-                detail="LLM did not generate a response. Please try again with different text."
+                detail=f"LLM did not generate a response: {llm_error}. Please try again with different text."
             )
         
-        llm_text = llm_response.text.strip()
-        print(f"✅ Gemini response generated: {llm_text[:100]}...")
-        print(f"📏 Original response length: {len(llm_text)} characters")
+        logger.debug("✅ Gemini response generated: %s...", llm_text[:100])
+        logger.debug("📏 Original response length: %s characters", len(llm_text))
         
         # Truncate text if it exceeds Murf's limit (3000 characters)
-        MAX_MURF_CHARS = 3000
         full_response = llm_text  # Keep the full response for the message
         
         if len(llm_text) > MAX_MURF_CHARS:
             # Truncate intelligently at a sentence boundary if possible
             truncated_text = llm_text[:MAX_MURF_CHARS]
             
-            # Try to find the last complete sentence
-            last_period = truncated_text.rfind('.')
-            last_exclamation = truncated_text.rfind('!')
-            last_question = truncated_text.rfind('?')
-            
-            # Find the last sentence ending
-            last_sentence_end = max(last_period, last_exclamation, last_question)
+            # Find the last sentence ending (punctuation followed by whitespace, so "3.14" does not count)
+            last_sentence_end = find_last_sentence_end(truncated_text)
             
             if last_sentence_end > MAX_MURF_CHARS * 0.8:  # If we have at least 80% of the text with a complete sentence
                 llm_text = truncated_text[:last_sentence_end + 1]
@@ -721,32 +1635,24 @@ async def query_llm(
                 else:
                     llm_text = truncated_text + "..."
             
-            print(f"⚠️ Response truncated from {len(full_response)} to {len(llm_text)} characters for Murf TTS")
-            print(f"📝 Truncated at: ...{llm_text[-50:]}")
+            logger.debug("⚠️ Response truncated from %s to %s characters for Murf TTS", len(full_response), len(llm_text))
+            logger.debug("📝 Truncated at: ...%s", llm_text[-50:])
         
         # Step 3: Generate Murf audio from LLM response
-        print(f"🎤 Generating Murf audio for LLM response...")
+        logger.debug("🎤 Generating Murf audio for LLM response...")
         
         # Use a professional voice for LLM responses
         murf_voice = "en-US-marcus"  # Professional male voice
         murf_style = "Neutral"
         
-        murf_response = murf_client.text_to_speech.generate(
-            text=llm_text,
-            voice_id=murf_voice,
-            style=murf_style
-        )
-        
-        # Extract audio URL from response
-        audio_url = None
-        if hasattr(murf_response, 'audio_url'):
-            audio_url = murf_response.audio_url
-        elif hasattr(murf_response, 'audio_file'):
-            audio_url = str(murf_response.audio_file)
-        else:
-            audio_url = str(murf_response)
+        audio_url, tts_error = await cached_tts(llm_text, murf_voice, murf_style)
+        if tts_error:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Failed to process LLM query: {tts_error}"
+            )
         
-        print(f"✅ Murf audio generated successfully! URL: {audio_url}")
+        logger.debug("✅ Murf audio generated successfully! URL: %s", audio_url)
         
         # Step 4: Return the audio response with metadata
         # Use the full response for the message display but the truncated version was used for audio
@@ -761,14 +1667,14 @@ async def query_llm(
             success=True,
             message=response_message,
             audio_url=audio_url,
-            audio_file=str(murf_response.audio_file) if hasattr(murf_response, 'audio_file') else audio_url,
-            word_count=len(llm_text.split())
+            audio_file=audio_url,
+            word_count=count_words(llm_text)
         )
         
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ LLM Query error: {str(e)}")
+        logger.error("❌ LLM Query error: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to process LLM query: {str(e)}"
@@ -802,111 +1708,83 @@ async def chat_with_history(
     user_message = None
     assistant_message = None
     audio_url = None
+    audio_urls = None
+    message_count = 0
     
     try:
-        print(f"\n{'='*60}")
-        print(f"🛡️ ROBUST CHAT SESSION STARTED")
-        print(f"🎭 Session ID: {session_id}")
-        print(f"📝 Current message count in session: {len(chat_sessions[session_id])}")
-        print(f"🎤 Processing audio: {audio_file.filename}")
+        # Read once and tracked locally as messages are appended (the stores keep at most MAX_HISTORY_MESSAGES * 2)
+        message_count = await chat_store.count(session_id)
+        
+        logger.debug("=" * 60)
+        logger.debug("🛡️ ROBUST CHAT SESSION STARTED")
+        logger.debug("🎭 Session ID: %s", session_id)
+        logger.debug("📝 Current message count in session: %s", message_count)
+        logger.debug("🎤 Processing audio: %s", audio_file.filename)
         
         # Validate audio file
-        if not audio_file.content_type or not audio_file.content_type.startswith('audio/'):
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid file type. Only audio files are allowed."
-            )
+        validate_audio_upload(audio_file)
         
         # STEP 1: TRANSCRIBE AUDIO WITH ERROR HANDLING
-        print("\n🎯 1️⃣ TRANSCRIBING AUDIO (with fallback)...")
-        audio_data = await audio_file.read()
-        print(f"📊 Audio data size: {len(audio_data)} bytes")
+        logger.debug("🎯 1️⃣ TRANSCRIBING AUDIO (with fallback)...")
+        logger.debug("📊 Audio data size: %s bytes", audio_file.size)
         
-        user_message, transcript_error = safe_transcribe_audio(audio_data)
+        user_message, transcript_error = await limited_transcribe_audio(await prepare_audio_for_stt(audio_file))
         
         if transcript_error:
-            print(f"🔴 STT Error: {transcript_error}")
-            error_type = "stt_error"
-            fallback_message = FALLBACK_MESSAGES[error_type]
-            
-            # Try to generate fallback audio
-            fallback_audio = generate_fallback_tts(fallback_message)
-            
-            return ChatResponse(
-                success=False,
-                message=fallback_message,
-                audio_url=fallback_audio,
-                transcript=None,
-                llm_response=fallback_message,
-                session_id=session_id,
-                message_count=len(chat_sessions[session_id]),
-                error_type=error_type,
-                fallback_used=True
-            )
+            logger.error("🔴 STT Error: %s", transcript_error)
+            return FALLBACK_RESPONSES["stt_error"].model_copy(update={
+                "session_id": session_id,
+                "message_count": message_count
+            })
         
-        print(f"✅ STT Success: '{user_message[:100]}...'")
+        logger.debug("✅ STT Success: '%s...'", user_message[:100])
         
         # Add user message to chat history
-        chat_sessions[session_id].append({
+        await chat_store.append(session_id, {
             "role": "user",
             "content": user_message,
-            "timestamp": datetime.now().isoformat()
+            "ts": time.time()
         })
+        message_count = min(message_count + 1, MAX_HISTORY_MESSAGES * 2)
         
         # STEP 2: PREPARE CONVERSATION CONTEXT
-        print(f"\n🎯 2️⃣ PREPARING CONVERSATION CONTEXT...")
-        
-        # Get recent messages from history (limit to prevent token overflow)
-        recent_messages = chat_sessions[session_id][-MAX_HISTORY_MESSAGES:]
-        
-        # Build conversation prompt
-        conversation_prompt = "You are a helpful AI assistant. Here is our conversation so far:\n\n"
+        logger.debug("🎯 2️⃣ PREPARING CONVERSATION CONTEXT...")
         
-        for msg in recent_messages:
-            role_label = "User" if msg["role"] == "user" else "Assistant"
-            conversation_prompt += f"{role_label}: {msg['content']}\n\n"
+        # Get the summary of older turns and the recent history as prompt lines (limited to prevent token overflow)
+        summary, turns = await chat_store.get_prompt_context(session_id)
         
-        # If this is continuing a conversation, add context
-        if len(recent_messages) > 1:
-            conversation_prompt += "Please continue our conversation naturally, remembering what we discussed earlier.\n"
+        # Build the conversation as structured turns, after the fixed system prompt
+        chat_contents = build_chat_contents(turns, summary)
         
-        print(f"📜 Context includes {len(recent_messages)} messages")
-        print(f"📏 Total prompt length: {len(conversation_prompt)} characters")
+        logger.debug("📜 Context includes %s messages%s", len(turns), " plus a summary" if summary else "")
+        logger.debug("📏 Conversation turns sent: %s", len(chat_contents))
         
         # STEP 3: GENERATE LLM RESPONSE WITH ERROR HANDLING
-        print(f"\n🎯 3️⃣ GENERATING LLM RESPONSE (with fallback)...")
+        logger.debug("🎯 3️⃣ GENERATING LLM RESPONSE (with fallback)...")
         
-        assistant_message, llm_error = safe_generate_llm_response(conversation_prompt)
+        # Warm up the Murf connection while Gemini is generating, without ever waiting on it
+        tts_warm = asyncio.create_task(prewarm_murf_connection())
+        background_tasks.add(tts_warm)
+        tts_warm.add_done_callback(background_tasks.discard)
+        assistant_message, llm_error = await safe_generate_chat_response(chat_contents)
         
         if llm_error:
-            print(f"🔴 LLM Error: {llm_error}")
+            logger.error("🔴 LLM Error: %s", llm_error)
             error_type = "llm_error"
             assistant_message = FALLBACK_MESSAGES[error_type]
             fallback_used = True
-            print(f"🔄 Using fallback response: '{assistant_message}'")
+            logger.debug("🔄 Using fallback response: '%s'", assistant_message)
         else:
-            print(f"✅ LLM Success: '{assistant_message[:100]}...'")
-        
-        # Add assistant response to chat history
-        chat_sessions[session_id].append({
-            "role": "assistant",
-            "content": assistant_message,
-            "timestamp": datetime.now().isoformat()
-        })
+            logger.debug("✅ LLM Success: '%s...'", assistant_message[:100])
         
         # STEP 4: PREPARE TEXT FOR TTS (with intelligent truncation)
-        print(f"\n🎯 4️⃣ PREPARING TEXT FOR TTS...")
-        MAX_MURF_CHARS = 3000
+        logger.debug("🎯 4️⃣ PREPARING TEXT FOR TTS...")
         tts_text = assistant_message
         
         if len(tts_text) > MAX_MURF_CHARS:
             # Intelligent truncation
             truncated = tts_text[:MAX_MURF_CHARS]
-            last_sentence = max(
-                truncated.rfind('.'),
-                truncated.rfind('!'),
-                truncated.rfind('?')
-            )
+            last_sentence = find_last_sentence_end(truncated)
             
             if last_sentence > MAX_MURF_CHARS * 0.8:
                 tts_text = truncated[:last_sentence + 1]
@@ -915,35 +1793,48 @@ async def chat_with_history(
                 tts_text = truncated[:last_space] if last_space > 0 else truncated
                 tts_text += "..."
             
-            print(f"⚠️ Response truncated for TTS: {len(assistant_message)} → {len(tts_text)} chars")
+            logger.debug("⚠️ Response truncated for TTS: %s → %s chars", len(assistant_message), len(tts_text))
         
         # STEP 5: GENERATE TTS AUDIO WITH ERROR HANDLING
-        print(f"\n🎯 5️⃣ GENERATING TTS AUDIO (with fallback)...")
+        logger.debug("🎯 5️⃣ GENERATING TTS AUDIO (with fallback)...")
         
         # Choose voice based on whether we're using fallback or not
         voice = "en-US-ken" if fallback_used else "en-US-claire"
         style = "Neutral" if fallback_used else "Cheerful"
         
-        print(f"🎤 Voice: {voice}, Style: {style}")
+        logger.debug("🎤 Voice: %s, Style: %s", voice, style)
         
-        audio_url, tts_error = safe_generate_tts(tts_text, voice, style)
+        history_append = chat_store.append(session_id, {
+            "role": "assistant",
+            "content": assistant_message,
+            "ts": time.time()
+        })
+        if fallback_used and error_type in FALLBACK_AUDIO_URLS:
+            # The fallback message was synthesized at startup, so Murf is not called again
+            audio_urls, tts_error = [FALLBACK_AUDIO_URLS[error_type]], None
+            await history_append
+        else:
+            # Sentence segments are synthesized concurrently and played back in order by the client,
+            # while the assistant response is added to chat history
+            (audio_urls, tts_error), _ = await asyncio.gather(
+                safe_generate_tts_segments(tts_text, voice, style),
+                history_append
+            )
+        message_count = min(message_count + 1, MAX_HISTORY_MESSAGES * 2)
+        schedule_summary(session_id)
+        audio_url = audio_urls[0] if audio_urls else None
         
         if tts_error:
-            print(f"🔴 TTS Error: {tts_error}")
+            logger.error("🔴 TTS Error: %s", tts_error)
             if not error_type:  # Only set error type if not already set
                 error_type = "tts_error"
             # TTS failed, but we still have the text response
-            print(f"⚠️ Audio unavailable, but text response available")
+            logger.warning("⚠️ Audio unavailable, but text response available")
         else:
-            print(f"✅ TTS Success: {audio_url}")
+            logger.debug("✅ TTS Success: %s audio segment(s)", len(audio_urls))
         
         # STEP 6: CLEANUP AND FINALIZATION
-        print(f"\n🎯 6️⃣ FINALIZING RESPONSE...")
-        
-        # Clean up old messages if history is too long
-        if len(chat_sessions[session_id]) > MAX_HISTORY_MESSAGES * 2:
-            chat_sessions[session_id] = chat_sessions[session_id][-MAX_HISTORY_MESSAGES:]
-            print(f"🧹 Cleaned up old messages, kept last {MAX_HISTORY_MESSAGES}")
+        logger.debug("🎯 6️⃣ FINALIZING RESPONSE...")
         
         # Determine success status
         overall_success = not (transcript_error or (llm_error and not fallback_used))
@@ -967,52 +1858,233 @@ async def chat_with_history(
         
         status_message = " | ".join(status_parts)
         
-        print(f"\n{'='*60}")
-        print(f"📊 FINAL STATUS: {status_message}")
-        print(f"🎭 Session Messages: {len(chat_sessions[session_id])}")
-        print(f"🔄 Fallback Used: {fallback_used}")
-        print(f"🎵 Audio Available: {bool(audio_url)}")
-        print(f"{'='*60}\n")
+        logger.debug("=" * 60)
+        logger.debug("📊 FINAL STATUS: %s", status_message)
+        logger.debug("🎭 Session Messages: %s", message_count)
+        logger.debug("🔄 Fallback Used: %s", fallback_used)
+        logger.debug("🎵 Audio Available: %s", bool(audio_url))
+        logger.debug("=" * 60)
         
         # Return comprehensive response
-        return ChatResponse(
+        return ChatResponse.model_construct(
             success=overall_success,
             message=status_message,
             audio_url=audio_url,
+            audio_urls=audio_urls,
             transcript=user_message,
             llm_response=assistant_message,
             session_id=session_id,
-            message_count=len(chat_sessions[session_id]),
+            message_count=message_count,
             error_type=error_type,
             fallback_used=fallback_used
         )
         
     except HTTPException as he:
         # Re-raise HTTP exceptions as-is
-        print(f"🔴 HTTP Exception: {he.detail}")
+        logger.warning("🔴 HTTP Exception: %s", he.detail)
         raise he
         
     except Exception as e:
         # Handle any unexpected errors
-        print(f"🔴 Unexpected Error: {str(e)}")
+        logger.error("🔴 Unexpected Error: %s", e)
         error_type = get_error_type(e)
         fallback_message = FALLBACK_MESSAGES.get(error_type, FALLBACK_MESSAGES["general_error"])
+        fallback_audio = FALLBACK_AUDIO_URLS.get(error_type, FALLBACK_AUDIO_URLS.get("general_error"))
         
-        # Try to generate fallback audio
-        fallback_audio = generate_fallback_tts(fallback_message)
-        
-        return ChatResponse(
+        return ChatResponse.model_construct(
             success=False,
             message=f"Unexpected error occurred: {fallback_message}",
             audio_url=fallback_audio,
             transcript=user_message,
             llm_response=fallback_message,
             session_id=session_id,
-            message_count=len(chat_sessions[session_id]),
+            message_count=message_count,
             error_type=error_type,
             fallback_used=True
         )
 
+@app.post("/agent/chat/{session_id}/stream", summary="Streaming Conversational Chat", description="Chat endpoint that streams the reply as server-sent events, with audio for each sentence as soon as it is ready")
+async def stream_chat_with_history(
+    session_id: str = Path(..., description="Unique session identifier for conversation history"),
+    audio_file: UploadFile = File(..., description="Audio file containing user's message")
+):
+    """
+    Streaming variant of /agent/chat/{session_id}. Gemini's reply is streamed and each
+    sentence is sent to Murf as soon as it is complete, so the first audio is ready
+    long before the full reply has been generated.
+    
+    Events (text/event-stream, JSON data):
+    - **transcript**: the recognized user message
+    - **sentence**: `index`, `text` and `audio_url` for each sentence, in order
+    - **done**: the full `llm_response` and the session `message_count`
+    - **error**: `error_type`, fallback `message` and `audio_url` when a step fails
+    
+    - **session_id**: Unique identifier for the conversation session
+    - **audio_file**: Audio file containing the user's message
+    """
+    
+    # Validate audio file
+    validate_audio_upload(audio_file)
+    
+    logger.debug("🌊 Streaming chat for session %s: %s", session_id, audio_file.filename)
+    
+    # The upload is only readable while the handler runs, so transcribe before streaming
+    user_message, transcript_error = await limited_transcribe_audio(await prepare_audio_for_stt(audio_file))
+    
+    async def error_events(error_type: str):
+        fallback_message = FALLBACK_MESSAGES[error_type]
+        yield sse_event("error", {
+            "error_type": error_type,
+            "message": fallback_message,
+            "audio_url": FALLBACK_AUDIO_URLS.get(error_type)
+        })
+    
+    if transcript_error:
+        logger.error("🔴 STT Error: %s", transcript_error)
+        return StreamingResponse(error_events("stt_error"), media_type="text/event-stream")
+    
+    async def reply_events():
+        yield sse_event("transcript", {"transcript": user_message})
+        
+        # Sentences are queued with their TTS tasks so audio is emitted in order while Gemini keeps streaming
+        sentence_queue, sentences, producer = await start_streamed_reply(
+            session_id, user_message, lambda sentence: asyncio.create_task(cached_tts(sentence))
+        )
+        try:
+            index = 0
+            while (item := await sentence_queue.get()) is not None:
+                sentence, tts_task = item
+                audio_url = None
+                if tts_task:
+                    audio_url, tts_error = await tts_task
+                    if tts_error:
+                        logger.error("🔴 TTS Error: %s", tts_error)
+                yield sse_event("sentence", {"index": index, "text": sentence, "audio_url": audio_url})
+                index += 1
+            
+            # Surface an LLM failure raised inside the producer
+            await producer
+        except Exception as e:
+            logger.error("🔴 Streaming Error: %s", e)
+            error_type = "llm_error" if not sentences else get_error_type(e)
+            async for event in error_events(error_type):
+                yield event
+            return
+        finally:
+            # Stop generating if the client went away or a step failed
+            producer.cancel()
+        
+        assistant_message = await save_streamed_reply(session_id, sentences)
+        
+        logger.debug("✅ Streamed %s sentence(s) for session %s", len(sentences), session_id)
+        yield sse_event("done", {
+            "session_id": session_id,
+            "llm_response": assistant_message,
+            "message_count": await chat_store.count(session_id)
+        })
+    
+    if not gemini_client:
+        return StreamingResponse(error_events("llm_error"), media_type="text/event-stream")
+    
+    return StreamingResponse(reply_events(), media_type="text/event-stream")
+
+@app.post("/agent/chat/{session_id}/audio", summary="Audio Streaming Conversational Chat", description="Chat endpoint that streams the spoken reply as MP3 while it is being generated")
+async def audio_chat_with_history(
+    session_id: str = Path(..., description="Unique session identifier for conversation history"),
+    audio_file: UploadFile = File(..., description="Audio file containing user's message")
+):
+    """
+    Audio-only variant of /agent/chat/{session_id}. Gemini's reply is streamed and each
+    complete sentence is piped through Murf's streaming TTS, so playback can start as soon
+    as the first sentence is spoken instead of after the whole reply is synthesized.
+    
+    Returns `audio/mpeg`. The URL-encoded transcript is sent in the `X-Transcript` header,
+    the session in `X-Session-Id`, and `X-Error-Type` is set when fallback audio is streamed.
+    
+    - **session_id**: Unique identifier for the conversation session
+    - **audio_file**: Audio file containing the user's message
+    """
+    
+    # Validate audio file
+    validate_audio_upload(audio_file)
+    
+    if not murf_client:
+        raise HTTPException(status_code=503, detail="Text-to-speech service is not available")
+    
+    logger.debug("🔈 Audio streaming chat for session %s: %s", session_id, audio_file.filename)
+    
+    # The upload is only readable while the handler runs, so transcribe before streaming
+    user_message, transcript_error = await limited_transcribe_audio(await prepare_audio_for_stt(audio_file))
+    # MP3 does not compress, and a declared encoding keeps GZipMiddleware from buffering the stream
+    headers = {"X-Session-Id": session_id, "Content-Encoding": "identity"}
+    
+    if transcript_error or not gemini_client:
+        error_type = "stt_error" if transcript_error else "llm_error"
+        logger.error("🔴 %s: %s", error_type, transcript_error or 'AI language model is not available')
+        headers["X-Error-Type"] = error_type
+        return StreamingResponse(
+            stream_fallback_audio(error_type),
+            media_type="audio/mpeg",
+            headers=headers
+        )
+    
+    headers["X-Transcript"] = quote(user_message)
+    
+    # Set when fallback audio is spoken instead of the reply
+    fallback: Dict[str, str] = {}
+    
+    async def reply_audio():
+        # Gemini keeps streaming into the queue while earlier sentences are being spoken; each sentence
+        # comes with its (not yet started) Murf audio stream
+        sentence_queue, sentences, producer = await start_streamed_reply(session_id, user_message, stream_tts_audio)
+        audio_sent = False
+        try:
+            while (item := await sentence_queue.get()) is not None:
+                _, tts_audio = item
+                if tts_audio:
+                    async for chunk in tts_audio:
+                        audio_sent = True
+                        yield chunk
+            
+            # Surface an LLM failure raised inside the producer
+            await producer
+        except Exception as e:
+            logger.error("🔴 Audio Streaming Error: %s", e)
+            llm_failed = producer.done() and producer.exception() is not None
+            # Nothing has been spoken yet, so the fallback message can take the reply's place
+            if not audio_sent:
+                fallback["error_type"] = "llm_error" if llm_failed else "tts_error"
+                async for chunk in stream_fallback_audio(fallback["error_type"]):
+                    yield chunk
+            if llm_failed:
+                return
+            
+            # Only Murf failed, so the reply is still generated and kept in the history
+            try:
+                await producer
+            except Exception as e:
+                logger.error("🔴 Audio Streaming Error: %s", e)
+                return
+        finally:
+            # Stop generating if the client went away or a step failed
+            producer.cancel()
+        
+        await save_streamed_reply(session_id, sentences)
+        logger.debug("✅ Spoke %s sentence(s) for session %s", len(sentences), session_id)
+    
+    # Headers go out with the first audio, so wait for it to know whether the fallback is being spoken
+    reply = reply_audio()
+    first_chunk = await anext(reply, b"")
+    if "error_type" in fallback:
+        headers["X-Error-Type"] = fallback["error_type"]
+    
+    async def stream_reply():
+        yield first_chunk
+        async for chunk in reply:
+            yield chunk
+    
+    return StreamingResponse(stream_reply(), media_type="audio/mpeg", headers=headers)
+
 @app.get("/agent/history/{session_id}", summary="Get Chat History", description="Retrieve conversation history for a session")
 async def get_chat_history(
     session_id: str = Path(..., description="Session ID to retrieve history for")
@@ -1022,14 +2094,18 @@ async def get_chat_history(
     
     - **session_id**: The session identifier
     """
-    history = chat_sessions.get(session_id, [])
+    history = await chat_store.get_messages(session_id)
     
-    return {
+    # Returned as a response so orjson serializes the messages directly, without FastAPI's jsonable_encoder pass
+    return ORJSONResponse({
         "session_id": session_id,
         "message_count": len(history),
-        "messages": history,
+        "messages": [
+            {"role": message["role"], "content": message["content"], "timestamp": format_message_time(message)}
+            for message in history
+        ],
         "max_history": MAX_HISTORY_MESSAGES
-    }
+    })
 
 @app.delete("/agent/history/{session_id}", summary="Clear Chat History", description="Clear conversation history for a session")
 async def clear_chat_history(
@@ -1040,9 +2116,8 @@ async def clear_chat_history(
     
     - **session_id**: The session identifier
     """
-    if session_id in chat_sessions:
-        message_count = len(chat_sessions[session_id])
-        del chat_sessions[session_id]
+    message_count = await chat_store.clear(session_id)
+    if message_count:
         return {
             "success": True,
             "message": f"Cleared {message_count} messages from session {session_id}",
@@ -1060,20 +2135,12 @@ async def list_sessions():
     """
     Get a list of all active chat sessions.
     """
-    sessions = []
-    for session_id, messages in chat_sessions.items():
-        if messages:
-            sessions.append({
-                "session_id": session_id,
-                "message_count": len(messages),
-                "last_message_time": messages[-1].get("timestamp") if messages else None,
-                "first_message_time": messages[0].get("timestamp") if messages else None
-            })
+    sessions = await chat_store.list_sessions()
     
-    return {
+    return ORJSONResponse({
         "total_sessions": len(sessions),
         "sessions": sessions
-    }
+    })
 
 @app.get("/favicon.ico")
 async def favicon():
@@ -1087,17 +2154,27 @@ async def favicon():
 @app.get("/health", summary="Health Check")
 async def health_check():
     """Health check endpoint to verify API configuration"""
-    return {
-        "status": "healthy",
+    try:
+        store_stats = await chat_store.stats()
+        chat_store_available = True
+    except Exception as e:
+        logger.warning("⚠️ Chat store unavailable: %s", e)
+        store_stats = {"active_sessions": None, "total_messages": None}
+        chat_store_available = False
+    
+    return ORJSONResponse({
+        "status": "healthy" if chat_store_available else "degraded",
         "message": "Conversational AI Assistant with Memory is running!",
         "api_key_configured": bool(MURF_API_KEY),
         "sdk_initialized": bool(murf_client),
         "assemblyai_configured": bool(ASSEMBLYAI_API_KEY),
-        "assemblyai_initialized": bool(aai_transcriber),
+        "assemblyai_initialized": bool(aai_client),
         "gemini_configured": bool(GEMINI_API_KEY),
         "gemini_initialized": bool(gemini_client),
-        "active_sessions": len(chat_sessions),
-        "total_messages": sum(len(msgs) for msgs in chat_sessions.values()),
+        "redis_configured": bool(REDIS_URL),
+        "event_loop": type(asyncio.get_running_loop()).__module__.split(".")[0],
+        "chat_store_available": chat_store_available,
+        **store_stats,
         "features": [
             "Text-to-Speech generation",
             "Voice recording (Echo Bot)",
@@ -1111,8 +2188,22 @@ async def health_check():
             "Multiple voice options",
             "Volume and playback controls"
         ]
-    }
+    })
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="127.0.0.1", port=8000)
+    
+    # Worker count follows uvicorn's WEB_CONCURRENCY convention
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    if workers > 1 and not redis_client:
+        logger.warning("⚠️ Warning: running multiple workers without REDIS_URL, chat sessions will not be shared between workers!")
+    
+    # Multiple workers need the app as an import string; uvloop is unavailable on Windows
+    uvicorn.run(
+        "main:app",
+        host="127.0.0.1",
+        port=8000,
+        workers=workers,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
+    )